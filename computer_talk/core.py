@@ -3,13 +3,121 @@ Core functionality for computer communication.
 """
 
 import logging
+import re
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from .exceptions import ComputerTalkError, CommunicationError
-from .config import get_task_description
+from .config import get_task_description, set_task_description
 from .desktop import DesktopManager
 
 
+# Canonical spelling of app names recognised in "open" commands
+_APP_NAMES = {
+    "mail": "Mail",
+    "email": "Mail",
+    "safari": "Safari",
+    "chrome": "Chrome",
+    "firefox": "Firefox",
+    "terminal": "Terminal",
+    "finder": "Finder",
+    "notes": "Notes",
+    "calendar": "Calendar",
+    "slack": "Slack",
+    "discord": "Discord",
+    "zoom": "Zoom",
+    "notion": "Notion",
+    "figma": "Figma",
+    "vscode": "VSCode",
+    "code": "Code",
+    "xcode": "Xcode",
+    "photos": "Photos",
+    "preview": "Preview",
+    "spotify": "Spotify",
+    "music": "Music",
+    "itunes": "iTunes",
+    "textedit": "TextEdit",
+    "pages": "Pages",
+    "numbers": "Numbers",
+    "keynote": "Keynote",
+}
+_APP_NAME_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, _APP_NAMES)) + r")\b", re.IGNORECASE
+)
+
+# Fixed parts of the hello/time/status replies
+_HELLO_PREFIX = "Hello! I received your message: "
+_TIME_PREFIX = "Current time: "
+_TIME_FMT = "%Y-%m-%d %H:%M:%S"
+_STATUS_PREFIX = "Status: Running, uptime: "
+
+# "<app> and send a message [to] [<recipient> [that says|saying <message>]]";
+# rcpt is None when the recipient is missing so the handler can report it
+_OPEN_MSG_RE = re.compile(
+    r"^(?P<app>.+?)\s+and\s+send\s+a\s+message(?:\s+to)?"
+    r"(?:\s+(?P<rcpt>.+?)(?:\s+(?:that\s+says|saying)\s+(?P<msg>.+))?)?$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Task description read from the user config, reloaded at most once per TTL
+_TASK_CACHE_TTL = 1.0
+_task_description: Optional[str] = None
+_task_loaded_at: Optional[float] = None
+
+
+def _cached_task_description() -> Optional[str]:
+    """Return the user's task description, re-reading the config after the TTL."""
+    global _task_description, _task_loaded_at
+    now = time.monotonic()
+    if _task_loaded_at is None or now - _task_loaded_at > _TASK_CACHE_TTL:
+        _task_description = get_task_description()
+        _task_loaded_at = now
+    return _task_description
+
+
+def _set_task_description(task: str) -> None:
+    """Store the task description and invalidate the cached copy."""
+    global _task_loaded_at
+    set_task_description(task)
+    _task_loaded_at = None
+
+
+# AppleScript programs fed to "osascript -" on stdin; argv is (recipient, message)
+_IMESSAGE_API_SCRIPT = '''
+on run argv
+    set theRecipient to item 1 of argv
+    set theMessage to item 2 of argv
+    tell application "Messages"
+        set targetBuddy to buddy theRecipient of (1st service whose service type = iMessage)
+        send theMessage to targetBuddy
+    end tell
+end run
+'''
+
+_IMESSAGE_UI_SCRIPT = '''
+on run argv
+    set theRecipient to item 1 of argv
+    set theMessage to item 2 of argv
+    tell application "Messages"
+        activate
+        delay 2
+        tell application "System Events"
+            keystroke "n" using command down
+            delay 2
+            keystroke theRecipient
+            delay 1
+            keystroke return
+            delay 3
+            keystroke tab
+            delay 1
+            keystroke theMessage
+            delay 1
+            keystroke return
+        end tell
+    end tell
+end run
+'''
+
+
 class ComputerTalk:
     """
     Main class for computer communication and interaction.
@@ -20,6 +128,20 @@ class ComputerTalk:
     Can be used as a context manager for automatic cleanup.
     """
     
+    __slots__ = ("config", "is_running", "logger", "desktop")
+    
+    # basicConfig only needs to run once per process
+    _LOGGING_INITIALIZED = False
+    
+    CAPABILITIES: Tuple[str, ...] = (
+        "echo_messages",
+        "time_queries",
+        "status_queries",
+        "custom_responses",
+        "desktop_apps",
+        "app_control",
+    )
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize ComputerTalk instance.
@@ -35,11 +157,14 @@ class ComputerTalk:
         
     def _setup_logging(self) -> None:
         """Set up logging configuration."""
-        level = self.config.get('log_level', 'INFO')
-        logging.basicConfig(
-            level=getattr(logging, level.upper()),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        level = getattr(logging, self.config.get('log_level', 'INFO').upper())
+        if not ComputerTalk._LOGGING_INITIALIZED:
+            logging.basicConfig(
+                level=level,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            ComputerTalk._LOGGING_INITIALIZED = True
+        self.logger.setLevel(level)
         
     def start(self) -> None:
         """
@@ -88,19 +213,26 @@ class ComputerTalk:
             **kwargs: Additional message parameters
             
         Returns:
-            Response message
+            Response message, or an empty string for an empty message
             
         Raises:
             CommunicationError: If communication fails
         """
+        # Nothing to process (e.g. keepalive pings)
+        if not message:
+            return ""
+        
         if not self.is_running:
             raise CommunicationError("ComputerTalk is not running")
             
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         try:
-            self.logger.debug(f"Sending message: {message}")
+            if debug:
+                self.logger.debug("Sending message: %s", message)
             # Simulate message processing
             response = self._process_message(message, **kwargs)
-            self.logger.debug(f"Received response: {response}")
+            if debug:
+                self.logger.debug("Received response: %s", response)
             return response
         except Exception as e:
             raise CommunicationError(f"Failed to send message: {e}")
@@ -109,13 +241,16 @@ class ComputerTalk:
         """Initialize communication channels."""
         # Placeholder for channel initialization
         self.logger.debug("Initializing communication channels...")
-        time.sleep(0.1)  # Simulate initialization time
+        if self.config.get("simulate_latency"):
+            time.sleep(self.config["simulate_latency"])
         
     def _cleanup_channels(self) -> None:
         """Clean up communication channels."""
-        # Placeholder for channel cleanup
         self.logger.debug("Cleaning up communication channels...")
-        time.sleep(0.1)  # Simulate cleanup time
+        # Release the shared AppleScript interpreter, if any
+        self.desktop.close()
+        if self.config.get("simulate_latency"):
+            time.sleep(self.config["simulate_latency"])
         
     def _process_message(self, message: str, **kwargs) -> str:
         """
@@ -128,84 +263,116 @@ class ComputerTalk:
         Returns:
             Processed response
         """
-        # Get user's task description
-        task_description = get_task_description()
-        
         # Add debug logging
-        self.logger.debug(f"Processing message: '{message}'")
-        
-        # Simple echo response for demonstration
-        if message.lower().startswith("hello"):
-            return f"Hello! I received your message: {message}"
-        elif message.lower().startswith("time"):
-            return f"Current time: {time.strftime('%Y-%m-%d %H:%M:%S')}"
-        elif message.lower().startswith("status"):
-            return f"Status: Running, uptime: {time.time():.2f} seconds"
-        elif message.lower().startswith("task"):
-            if task_description:
-                return f"Your current task: {task_description}"
-            else:
-                return "No task description set. Run 'computer-talk --interactive' to set one."
-        elif message.lower().startswith("clear task"):
-            from .config import set_task_description
-            set_task_description("")
-            return "✅ Task cleared. You can set a new one anytime."
-        elif message.lower().startswith("open ") or message.lower().startswith("pen ") or message.lower().startswith("ope "):
-            # Handle app opening commands with intelligent parsing (including common typos)
-            self.logger.debug(f"Processing open message: '{message}'")
-            # Fix common typos
-            if message.lower().startswith("pen "):
-                message = "open " + message[4:]
-            elif message.lower().startswith("ope "):
-                message = "open " + message[4:]
-            return self._handle_open_command(message)
-        elif "send a message to " in message.lower() and (" saying " in message.lower() or self._is_likely_message_command(message)):
+        self.logger.debug("Processing message: '%s'", message)
+        
+        # Dispatch on the first word; handlers return None to fall through
+        message_lower = message.lower()
+        first_word, _, rest = message_lower.partition(" ")
+        handler = _COMMAND_HANDLERS.get(first_word.rstrip("!?,.:"))
+        if handler is not None:
+            response = handler(self, message, rest)
+            if response is not None:
+                return response
+        
+        if "send a message to " in message_lower and (" saying " in message_lower or self._is_likely_message_command(message)):
             # Handle direct message commands without "open"
-            self.logger.debug(f"Processing direct message: '{message}'")
+            self.logger.debug("Processing direct message: '%s'", message)
             return self._handle_direct_message_command(message)
-        elif message.lower() == "list apps" or message.lower().startswith("list apps"):
+        
+        # Check for fuzzy matches to "open" command
+        if self._is_likely_open_command(message):
+            self.logger.debug("Detected likely open command: '%s'", message)
+            # Try to fix the command
+            fixed_message = self._fix_open_command(message)
+            if fixed_message:
+                return self._handle_open_command(fixed_message)
+        
+        return f"Echo: {message}"
+    
+    def _cmd_hello(self, message: str, rest: str) -> Optional[str]:
+        """Handle 'hello' messages."""
+        return _HELLO_PREFIX + message
+    
+    def _cmd_time(self, message: str, rest: str) -> Optional[str]:
+        """Handle 'time' queries."""
+        return _TIME_PREFIX + time.strftime(_TIME_FMT)
+    
+    def _cmd_status(self, message: str, rest: str) -> Optional[str]:
+        """Handle 'status' queries."""
+        return f"{_STATUS_PREFIX}{time.time():.2f} seconds"
+    
+    def _cmd_task(self, message: str, rest: str) -> Optional[str]:
+        """Handle 'task' queries."""
+        task_description = _cached_task_description()
+        if task_description:
+            return f"Your current task: {task_description}"
+        return "No task description set. Run 'computer-talk --interactive' to set one."
+    
+    def _cmd_clear(self, message: str, rest: str) -> Optional[str]:
+        """Handle 'clear task'."""
+        if not rest.startswith("task"):
+            return None
+        _set_task_description("")
+        return "✅ Task cleared. You can set a new one anytime."
+    
+    def _cmd_open(self, message: str, rest: str) -> Optional[str]:
+        """Handle app opening commands, including the 'pen'/'ope' typos."""
+        if not rest:
+            return None
+        # Handle app opening commands with intelligent parsing (including common typos)
+        self.logger.debug("Processing open message: '%s'", message)
+        if message[:5].lower() != "open ":
+            message = "open " + message[4:]
+        return self._handle_open_command(message)
+    
+    def _cmd_list(self, message: str, rest: str) -> Optional[str]:
+        """Handle 'list apps' and 'list contacts'."""
+        if rest.startswith("apps"):
             try:
-                apps = self.list_apps()
+                apps = self.list_apps(limit=10)
                 if apps:
-                    app_list = "\n".join([f"• {app['name']}: {app['description']}" for app in apps[:10]])
+                    app_list = "\n".join(f"• {app['name']}: {app['description']}" for app in apps)
                     return f"Available apps:\n{app_list}\n\n(Showing first 10 apps)"
                 else:
                     return "No apps available"
             except Exception as e:
                 return f"❌ Failed to list apps: {e}"
-        elif message.lower() == "list contacts" or message.lower().startswith("list contacts"):
+        if rest.startswith("contacts"):
             return "📱 To see your contacts, open the Messages app and check the sidebar. The contact name must match exactly as it appears in Messages (e.g., 'Enya Mistry' not 'Enya')."
-        elif message.lower().startswith("find contact "):
-            contact_name = message[13:].strip()
-            return f"🔍 To find contact '{contact_name}':\n1. Open Messages app\n2. Look in the sidebar for exact name match\n3. Use the exact name as it appears there\n\nTip: Contact names are case-sensitive and must match exactly!"
-        elif message.lower() == "running apps" or message.lower().startswith("running apps"):
-            try:
-                apps = self.list_running_apps()
-                if apps:
-                    app_list = "\n".join([f"• {app['name']}" for app in apps[:10]])
-                    return f"Running apps:\n{app_list}\n\n(Showing first 10 apps)"
-                else:
-                    return "No running apps detected"
-            except Exception as e:
-                return f"❌ Failed to list running apps: {e}"
-        elif message.lower().startswith("close "):
-            # Handle app closing commands
-            app_name = message[6:].strip()
-            try:
-                result = self.interact_with_app(app_name, "quit")
-                return f"✅ {result['message']}"
-            except Exception as e:
-                return f"❌ Failed to close {app_name}: {e}"
-        else:
-            # Check for fuzzy matches to "open" command
-            if self._is_likely_open_command(message):
-                self.logger.debug(f"Detected likely open command: '{message}'")
-                # Try to fix the command
-                fixed_message = self._fix_open_command(message)
-                if fixed_message:
-                    return self._handle_open_command(fixed_message)
-            
-            return f"Echo: {message}"
+        return None
+    
+    def _cmd_find(self, message: str, rest: str) -> Optional[str]:
+        """Handle 'find contact'."""
+        if not rest.startswith("contact "):
+            return None
+        contact_name = message[13:].strip()
+        return f"🔍 To find contact '{contact_name}':\n1. Open Messages app\n2. Look in the sidebar for exact name match\n3. Use the exact name as it appears there\n\nTip: Contact names are case-sensitive and must match exactly!"
+    
+    def _cmd_running(self, message: str, rest: str) -> Optional[str]:
+        """Handle 'running apps'."""
+        if not rest.startswith("apps"):
+            return None
+        try:
+            apps = self.list_running_apps(limit=10)
+            if apps:
+                app_list = "\n".join(f"• {app['name']}" for app in apps)
+                return f"Running apps:\n{app_list}\n\n(Showing first 10 apps)"
+            else:
+                return "No running apps detected"
+        except Exception as e:
+            return f"❌ Failed to list running apps: {e}"
+    
+    def _cmd_close(self, message: str, rest: str) -> Optional[str]:
+        """Handle app closing commands."""
+        if not rest:
+            return None
+        app_name = message[6:].strip()
+        try:
+            result = self.interact_with_app(app_name, "quit")
+            return f"✅ {result['message']}"
+        except Exception as e:
+            return f"❌ Failed to close {app_name}: {e}"
     
     def _handle_open_command(self, message: str) -> str:
         """
@@ -219,10 +386,10 @@ class ComputerTalk:
         """
         # Remove 'open' prefix
         command = message[5:].strip()
-        self.logger.debug(f"Processing open command: '{command}'")
+        self.logger.debug("Processing open command: '%s'", command)
         
         # Parse different types of open commands
-        if " and send a message to " in command.lower() or " and send a message " in command.lower():
+        if _OPEN_MSG_RE.match(command):
             self.logger.debug("Detected message command")
             return self._handle_open_and_message_command(command)
         elif " and " in command.lower():
@@ -232,7 +399,7 @@ class ComputerTalk:
             # Simple app opening - extract just the app name
             self.logger.debug("Detected simple app opening")
             app_name = self._extract_app_name(command)
-            self.logger.debug(f"Extracted app name: '{app_name}'")
+            self.logger.debug("Extracted app name: '%s'", app_name)
             try:
                 result = self.open_app(app_name)
                 return f"✅ {result['message']}"
@@ -252,28 +419,17 @@ class ComputerTalk:
         try:
             # Parse: "messages and send a message to enya mistry that says 'it works!'"
             # or "messages and send a message to enya saying it works!"
-            if " and send a message to " in command.lower():
-                parts = command.split(" and send a message to ")
-            elif " and send a message " in command.lower():
-                parts = command.split(" and send a message ")
-            else:
+            match = _OPEN_MSG_RE.match(command)
+            if not match or match.group("rcpt") is None:
                 return f"❌ Could not parse message command: {command}"
             
-            if len(parts) != 2:
-                return f"❌ Could not parse message command: {command}"
-            
-            app_name = self._extract_app_name(parts[0].strip())
-            message_part = parts[1].strip()
+            app_name = self._extract_app_name(match.group("app").strip())
+            message_part = match.group("rcpt").strip()
             
             # Extract recipient and message - handle both patterns
-            if " that says " in message_part:
-                recipient, message_text = message_part.split(" that says ", 1)
-                recipient = recipient.strip()
-                message_text = message_text.strip().strip("'\"")
-            elif " saying " in message_part:
-                recipient, message_text = message_part.split(" saying ", 1)
-                recipient = recipient.strip()
-                message_text = message_text.strip().strip("'\"")
+            if match.group("msg") is not None:
+                recipient = message_part
+                message_text = match.group("msg").strip().strip("'\"")
             else:
                 # Try to parse without "saying" - be smarter about recipient vs message
                 words = message_part.split()
@@ -310,9 +466,8 @@ class ComputerTalk:
             except Exception as e:
                 return f"❌ Failed to open {app_name}: {e}"
             
-            # Wait a moment for app to open
-            import time
-            time.sleep(2)
+            # Wait for the app to come to the front
+            self._wait_for_app(app_name)
             
             # Send the message
             try:
@@ -405,9 +560,8 @@ class ComputerTalk:
                 except Exception as e:
                     return f"❌ Failed to open Messages: {e}"
                 
-                # Wait a moment for app to open
-                import time
-                time.sleep(2)
+                # Wait for the app to come to the front
+                self._wait_for_app("Messages")
                 
                 # Send the message
                 try:
@@ -424,6 +578,32 @@ class ComputerTalk:
         except Exception as e:
             return f"❌ Failed to process direct message: {e}"
     
+    def _wait_for_app(self, app_name: str, timeout: float = 2.0, interval: float = 0.25) -> bool:
+        """
+        Wait until an app is frontmost, polling instead of sleeping blindly.
+        
+        Each probe is given only the time left before the deadline, so the
+        whole wait never exceeds timeout.
+        
+        Args:
+            app_name: Name of the app to wait for
+            timeout: Maximum time to wait in seconds
+            interval: Delay between checks in seconds
+            
+        Returns:
+            True if the app became frontmost before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while True:
+            if self.desktop.is_app_frontmost(app_name, timeout=remaining):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= interval:
+                return False
+            time.sleep(interval)
+            remaining -= interval
+    
     def _is_likely_open_command(self, message: str) -> bool:
         """
         Check if a message is likely an "open" command with a typo.
@@ -548,11 +728,11 @@ class ComputerTalk:
                         contacts.append(contact)
                 return contacts
             else:
-                self.logger.warning(f"Failed to get contacts: {result.stderr}")
+                self.logger.warning("Failed to get contacts: %s", result.stderr)
                 return []
                 
         except Exception as e:
-            self.logger.error(f"Error listing contacts: {e}")
+            self.logger.error("Error listing contacts: %s", e)
             return []
     
     def _extract_app_name(self, command: str) -> str:
@@ -565,39 +745,17 @@ class ComputerTalk:
         Returns:
             Extracted app name
         """
-        # Common patterns to extract app names
-        command_lower = command.lower()
-        
-        # Handle special cases first
-        message_commands = [
-            "a message", "message", "messages", "send message", "new message",
-            "compose message", "write message", "text message", "imessage",
-            "my messages app", "messages app", "my message app", "message app"
-        ]
-        
-        # Check if any message command is in the string
-        for msg_cmd in message_commands:
-            if msg_cmd in command_lower:
-                return "Messages"
-        
-        # Also check for patterns like "my X app" where X contains "message"
-        if "my" in command_lower and "app" in command_lower and "message" in command_lower:
+        # Any mention of "message" (message app, imessage, ...) means Messages
+        if "message" in command.lower():
             return "Messages"
         
         # Look for common app names
-        app_patterns = [
-            "messages", "message", "mail", "email", "safari", "chrome", "firefox",
-            "terminal", "finder", "notes", "calendar", "slack", "discord", "zoom",
-            "notion", "figma", "vscode", "code", "xcode", "photos", "preview",
-            "spotify", "music", "itunes", "textedit", "pages", "numbers", "keynote"
-        ]
-        
-        for pattern in app_patterns:
-            if pattern in command_lower:
-                return pattern.title() if pattern in ["vscode", "xcode"] else pattern.capitalize()
+        match = _APP_NAME_RE.search(command)
+        if match:
+            return _APP_NAMES[match.group(1).lower()]
         
         # If no pattern matches, try to extract the first word
-        words = command.split()
+        words = command.split(None, 1)
         if words:
             return words[0].capitalize()
         
@@ -638,38 +796,13 @@ class ComputerTalk:
         try:
             import subprocess
             
-            # Escape special characters for AppleScript
-            def escape_applescript(text):
-                return text.replace('"', '\\"').replace('\\', '\\\\')
-            
-            escaped_recipient = escape_applescript(recipient)
-            escaped_message = escape_applescript(message)
-            
-            # Use UI method which is more forgiving with contact names
-            script_api = f'''
-            tell application "Messages"
-                activate
-                delay 2
-                tell application "System Events"
-                    keystroke "n" using command down
-                    delay 2
-                    keystroke "{escaped_recipient}"
-                    delay 1
-                    keystroke return
-                    delay 3
-                    keystroke tab
-                    delay 1
-                    keystroke "{escaped_message}"
-                    delay 1
-                    keystroke return
-                end tell
-            end tell
-            '''
-            
-            result = subprocess.run(["osascript", "-e", script_api], 
+            # Recipient and message are passed as argv so they are never
+            # interpolated into the script source
+            result = subprocess.run(["osascript", "-", recipient, message],
+                                  input=_IMESSAGE_API_SCRIPT,
                                   capture_output=True, text=True, timeout=30)
             
-            self.logger.debug(f"Messages API result: returncode={result.returncode}, stdout={result.stdout}, stderr={result.stderr}")
+            self.logger.debug("Messages API result: returncode=%s, stdout=%s, stderr=%s", result.returncode, result.stdout, result.stderr)
             
             if result.returncode == 0:
                 return {
@@ -679,29 +812,10 @@ class ComputerTalk:
                     "stderr": result.stderr
                 }
             
-            # Fallback to UI automation if API fails
+            # Fallback to UI automation if API fails (e.g. no exact buddy match)
             self.logger.warning("Messages API failed, trying UI automation fallback")
-            script_ui = f'''
-            tell application "Messages"
-                activate
-                delay 2
-                tell application "System Events"
-                    keystroke "n" using command down
-                    delay 2
-                    keystroke "{escaped_recipient}"
-                    delay 1
-                    keystroke return
-                    delay 3
-                    keystroke tab
-                    delay 1
-                    keystroke "{escaped_message}"
-                    delay 1
-                    keystroke return
-                end tell
-            end tell
-            '''
-            
-            result = subprocess.run(["osascript", "-e", script_ui], 
+            result = subprocess.run(["osascript", "-", recipient, message],
+                                  input=_IMESSAGE_UI_SCRIPT,
                                   capture_output=True, text=True, timeout=30)
             
             if result.returncode == 0:
@@ -751,21 +865,14 @@ class ComputerTalk:
             "uptime": time.time() if self.is_running else 0,
         }
         
-    def list_capabilities(self) -> List[str]:
+    def list_capabilities(self) -> Tuple[str, ...]:
         """
         List available capabilities.
         
         Returns:
-            List of capability strings
-        """
-        return [
-            "echo_messages",
-            "time_queries", 
-            "status_queries",
-            "custom_responses",
-            "desktop_apps",
-            "app_control",
-        ]
+            Read-only tuple of capability strings
+        """
+        return self.CAPABILITIES
         
     def __enter__(self):
         """Context manager entry."""
@@ -795,10 +902,13 @@ class ComputerTalk:
         except Exception as e:
             raise CommunicationError(f"Failed to open {app_name}: {e}")
     
-    def list_apps(self) -> List[Dict[str, Any]]:
+    def list_apps(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         List available applications.
         
+        Args:
+            limit: Maximum number of applications to return
+            
         Returns:
             List of available applications
         """
@@ -806,14 +916,17 @@ class ComputerTalk:
             raise CommunicationError("ComputerTalk is not running")
         
         try:
-            return self.desktop.get_common_apps()
+            return self.desktop.get_common_apps(limit=limit)
         except Exception as e:
             raise CommunicationError(f"Failed to list apps: {e}")
     
-    def list_running_apps(self) -> List[Dict[str, Any]]:
+    def list_running_apps(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         List currently running applications.
         
+        Args:
+            limit: Maximum number of applications to return
+            
         Returns:
             List of running applications
         """
@@ -821,7 +934,7 @@ class ComputerTalk:
             raise CommunicationError("ComputerTalk is not running")
         
         try:
-            return self.desktop.list_running_apps()
+            return self.desktop.list_running_apps(limit=limit)
         except Exception as e:
             raise CommunicationError(f"Failed to list running apps: {e}")
     
@@ -862,3 +975,20 @@ class ComputerTalk:
             return self.desktop.close_app(app_id)
         except Exception as e:
             raise CommunicationError(f"Failed to close app {app_id}: {e}")
+
+
+# First-word command dispatch table for ComputerTalk._process_message
+_COMMAND_HANDLERS = {
+    "hello": ComputerTalk._cmd_hello,
+    "time": ComputerTalk._cmd_time,
+    "status": ComputerTalk._cmd_status,
+    "task": ComputerTalk._cmd_task,
+    "clear": ComputerTalk._cmd_clear,
+    "open": ComputerTalk._cmd_open,
+    "pen": ComputerTalk._cmd_open,
+    "ope": ComputerTalk._cmd_open,
+    "list": ComputerTalk._cmd_list,
+    "find": ComputerTalk._cmd_find,
+    "running": ComputerTalk._cmd_running,
+    "close": ComputerTalk._cmd_close,
+}
@@ -3,30 +3,283 @@ Desktop application integration for computer-talk.
 Provides capabilities to open and interact with desktop applications.
 """
 
+import atexit
+import concurrent.futures
+import csv
+import io
+import itertools
 import subprocess
 import platform
+import select
+import threading
 import time
 import logging
 import os
 import psutil
 import shutil
 import json
-from typing import List, Dict, Any, Optional, Union
+import sys
+from collections import OrderedDict, namedtuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 
 from .exceptions import ComputerTalkError, CommunicationError
 
 
+# Host platform, resolved once at import
+_SYSTEM = platform.system().lower()
+
+# Shared pool for batch operations; the work is subprocess-bound so threads suffice
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+atexit.register(_EXECUTOR.shutdown)
+
+# Desktop openers tried in order for Linux apps that aren't on PATH
+_LINUX_OPENERS = ("xdg-open", "gnome-open", "kde-open")
+
+# Successful PATH lookups; misses are not cached so later installs are found
+_which_cache: Dict[str, str] = {}
+
+
+def _which(name: str) -> Optional[str]:
+    """shutil.which, remembering only the programs it found."""
+    path = _which_cache.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _which_cache[name] = path
+    return path
+
+
+# A tracked application launched by DesktopManager.open_application
+AppEntry = namedtuple("AppEntry", "name pid started_at status")
+
+# Fallback descriptions for well-known apps, keyed by app name
+_APP_DESCRIPTIONS = {
+    'Safari': 'Web browser',
+    'Chrome': 'Web browser',
+    'Firefox': 'Web browser',
+    'Terminal': 'Command line terminal',
+    'Finder': 'File manager',
+    'TextEdit': 'Text editor',
+    'Notes': 'Note-taking app',
+    'Calendar': 'Calendar app',
+    'Mail': 'Email client',
+    'Messages': 'Messaging app',
+    'Spotify': 'Music streaming',
+    'VSCode': 'Code editor',
+    'Visual Studio Code': 'Code editor',
+    'Xcode': 'iOS development',
+    'Photos': 'Photo management',
+    'Preview': 'PDF and image viewer',
+    'Notion': 'Note-taking and productivity',
+    'Slack': 'Team communication',
+    'Discord': 'Voice and text chat',
+    'Zoom': 'Video conferencing',
+    'Figma': 'Design tool',
+    'PyCharm': 'Python IDE',
+    'IntelliJ IDEA': 'Java IDE',
+    'WebStorm': 'JavaScript IDE',
+    'DataGrip': 'Database IDE',
+    'Android Studio': 'Android development',
+    'iTerm': 'Terminal emulator',
+    'Alacritty': 'Terminal emulator',
+    'Hyper': 'Terminal emulator',
+    'Docker Desktop': 'Container platform',
+    'Postman': 'API development',
+    'Insomnia': 'API client',
+    'TablePlus': 'Database client',
+    'Sequel Pro': 'MySQL client',
+    'Navicat': 'Database client',
+    'MongoDB Compass': 'MongoDB client',
+    'Redis Desktop Manager': 'Redis client',
+    'DBeaver': 'Database client',
+    'MySQL Workbench': 'MySQL client',
+    'pgAdmin': 'PostgreSQL client',
+    'Robo 3T': 'MongoDB client',
+    'Studio 3T': 'MongoDB client'
+}
+
+
+class _ScriptNotSent(OSError):
+    """Raised when a script never reached the interpreter, so it is safe to re-run."""
+
+
+class _OsascriptSession:
+    """
+    A long-lived ``osascript -i`` process that runs one-line AppleScripts.
+    
+    Reusing one interpreter avoids paying process and AppleScript start-up
+    for every interaction. Each script is followed by a sentinel string
+    literal whose echo marks the end of that script's output. The process
+    is started on first use and restarted after close(). After any failure
+    the session disables itself and every later run raises _ScriptNotSent,
+    so callers fall back to one-off osascript processes.
+    """
+    
+    _SENTINEL = "__computer_talk_done__"
+    
+    def __init__(self, command: Tuple[str, ...] = ("osascript", "-i")):
+        self._command = list(command)
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+    
+    def run(self, script: str, timeout: float = 10) -> Tuple[bool, str]:
+        """
+        Run a single-line script.
+        
+        Args:
+            script: AppleScript source without newlines
+            timeout: Seconds to wait for the script to finish
+            
+        Returns:
+            Tuple of (success, output or error text); success is False when
+            AppleScript reports an execution or syntax error
+            
+        Raises:
+            _ScriptNotSent: If the session is disabled or the script could not
+                be written to the interpreter; the script did not run
+            OSError: If the interpreter stops responding or exits after the
+                script was sent; it may have run, so it must not be retried
+        """
+        with self._lock:
+            if self._disabled:
+                raise _ScriptNotSent("osascript session disabled")
+            try:
+                output = self._run_locked(script, timeout)
+            except Exception:
+                self._disabled = True
+                self._stop()
+                raise
+        
+        lines = []
+        for line in output.splitlines():
+            # Drop the interactive prompt / result markers
+            line = line.strip()
+            while line[:2] in (">>", "=>", "? "):
+                line = line[2:].lstrip()
+            if line:
+                lines.append(line)
+        text = "\n".join(lines)
+        success = "execution error" not in text and "syntax error" not in text
+        return success, text
+    
+    def close(self) -> None:
+        """Terminate the interpreter; the next run starts a fresh one."""
+        with self._lock:
+            self._stop()
+    
+    def _run_locked(self, script: str, timeout: float) -> str:
+        """Send a script and read its output up to the sentinel."""
+        try:
+            if self._proc is None or self._proc.poll() is not None:
+                self._stop()
+                self._proc = subprocess.Popen(
+                    self._command,
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    bufsize=0
+                )
+            stdin, stdout = self._proc.stdin, self._proc.stdout
+            assert stdin is not None and stdout is not None
+            stdin.write(f'{script}\n"{self._SENTINEL}"\n'.encode())
+        except OSError as e:
+            raise _ScriptNotSent(f"could not send script to osascript: {e}") from e
+        
+        sentinel = self._SENTINEL.encode()
+        fd = stdout.fileno()
+        buf = b""
+        deadline = time.monotonic() + timeout
+        while sentinel not in buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise OSError("osascript did not respond in time")
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                raise OSError("osascript exited unexpectedly")
+            buf += chunk
+        
+        output = buf[:buf.index(sentinel)].decode(errors="replace")
+        # The sentinel's own result line starts with a quote; drop it
+        return output.rstrip().rstrip('"')
+    
+    def _stop(self) -> None:
+        """Kill the interpreter and release its pipes; caller holds the lock."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=1)
+        except Exception:
+            pass
+        for pipe in (proc.stdin, proc.stdout):
+            try:
+                if pipe is not None:
+                    pipe.close()
+            except Exception:
+                pass
+
+
+# Interpreter shared by all DesktopManagers for macOS app actions
+_OSASCRIPT = _OsascriptSession()
+atexit.register(_OSASCRIPT.close)
+
+
 class DesktopManager:
     """
     Manages desktop application interactions and control.
     """
     
+    # Seconds a list_running_apps result stays valid
+    RUNNING_APPS_TTL = 0.5
+    
+    # Seconds to wait for the macOS 'open' launcher to report success or failure
+    OPEN_LAUNCHER_TIMEOUT = 2.0
+    
+    # Oldest entries in running_apps are evicted beyond this many
+    MAX_TRACKED_APPS = 256
+    
+    # AppleScript for each supported macOS action; %s is the app name.
+    # The keys are the only actions _interact_macos_app accepts.
+    _MACOS_ACTIONS = {
+        "activate": 'tell application "%s" to activate',
+        "close": 'tell application "%s" to close',
+        "quit": 'tell application "%s" to quit',
+        "minimize": 'tell application "%s" to set minimized of window 1 to true',
+        "maximize": 'tell application "%s" to set zoomed of window 1 to true',
+    }
+    
+    # Source of unique app_id suffixes, shared by all managers
+    _id_counter = itertools.count()
+    
     def __init__(self):
         """Initialize the desktop manager."""
-        self.system = platform.system().lower()
+        self.system = _SYSTEM
         self.logger = logging.getLogger(__name__)
-        self.running_apps = {}
+        # Platform-specific implementations, None on unsupported systems
+        self._opener = {
+            "darwin": self._open_macos_app,
+            "windows": self._open_windows_app,
+            "linux": self._open_linux_app,
+        }.get(self.system)
+        self._lister = {
+            "darwin": self._list_macos_apps,
+            "windows": self._list_windows_apps,
+            "linux": self._list_linux_apps,
+        }.get(self.system)
+        self._discoverer = {
+            "darwin": self._discover_macos_apps,
+            "windows": self._discover_windows_apps,
+            "linux": self._discover_linux_apps,
+        }.get(self.system)
+        self._interactor = {
+            "darwin": self._interact_macos_app,
+            "windows": self._interact_windows_app,
+            "linux": self._interact_linux_app,
+        }.get(self.system)
+        self.running_apps: "OrderedDict[str, AppEntry]" = OrderedDict()
+        self._discovered_apps: Optional[List[Dict[str, Any]]] = None
+        self._running_apps_cache: Tuple[Optional[float], List[Dict[str, Any]]] = (None, [])
         self.app_communication = {}  # Track app-to-app communication
         self.system_info = self._get_system_info()
     
@@ -45,7 +298,7 @@ class DesktopManager:
                 "python_version": platform.python_version()
             }
         except Exception as e:
-            self.logger.error(f"Failed to get system info: {e}")
+            self.logger.error("Failed to get system info: %s", e)
             return {}
         
     def open_application(self, app_name: str, **kwargs) -> Dict[str, Any]:
@@ -63,34 +316,28 @@ class DesktopManager:
             ComputerTalkError: If app cannot be opened
         """
         try:
-            self.logger.info(f"Opening application: {app_name}")
+            self.logger.info("Opening application: %s", app_name)
             
             # First try to find the app using fuzzy matching
             discovered_app = self._find_app_by_name(app_name)
             if discovered_app:
                 actual_app_name = discovered_app["name"]
-                self.logger.info(f"Found app: {actual_app_name}")
+                self.logger.info("Found app: %s", actual_app_name)
             else:
                 actual_app_name = app_name
-                self.logger.info(f"Using provided name: {actual_app_name}")
-            
-            if self.system == "darwin":  # macOS
-                result = self._open_macos_app(actual_app_name, **kwargs)
-            elif self.system == "windows":
-                result = self._open_windows_app(actual_app_name, **kwargs)
-            elif self.system == "linux":
-                result = self._open_linux_app(actual_app_name, **kwargs)
-            else:
+                self.logger.info("Using provided name: %s", actual_app_name)
+            
+            if self._opener is None:
                 raise ComputerTalkError(f"Unsupported operating system: {self.system}")
+            result = self._opener(actual_app_name, **kwargs)
             
             # Store app info
-            app_id = f"{actual_app_name}_{int(time.time())}"
-            self.running_apps[app_id] = {
-                "name": actual_app_name,
-                "pid": result.get("pid"),
-                "started_at": time.time(),
-                "status": "running"
-            }
+            app_id = f"{actual_app_name}_{next(DesktopManager._id_counter)}"
+            self.running_apps[app_id] = AppEntry(
+                actual_app_name, result.get("pid"), time.time(), "running"
+            )
+            while len(self.running_apps) > self.MAX_TRACKED_APPS:
+                self.running_apps.popitem(last=False)
             
             return {
                 "success": True,
@@ -101,9 +348,31 @@ class DesktopManager:
             }
             
         except Exception as e:
-            self.logger.error(f"Failed to open {app_name}: {e}")
+            self.logger.error("Failed to open %s: %s", app_name, e)
             raise ComputerTalkError(f"Failed to open application {app_name}: {e}")
     
+    def open_applications(self, app_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Open several applications concurrently.
+        
+        Args:
+            app_names: Names or paths of the applications to open
+            
+        Returns:
+            Results in the same order as app_names; failures are reported
+            as {"success": False, ...} instead of raising
+        """
+        # Fill the discovery cache up front so the workers share one scan
+        self.get_common_apps()
+        return list(_EXECUTOR.map(self._open_application_safe, app_names))
+    
+    def _open_application_safe(self, app_name: str) -> Dict[str, Any]:
+        """Open an application, returning failures as a result dict."""
+        try:
+            return self.open_application(app_name)
+        except Exception as e:
+            return {"success": False, "app_name": app_name, "error": str(e)}
+    
     def _find_app_by_name(self, search_name: str) -> Optional[Dict[str, Any]]:
         """
         Find an app by name using fuzzy matching.
@@ -116,7 +385,7 @@ class DesktopManager:
         """
         try:
             # Get all discovered apps
-            apps = self.discover_apps()
+            apps = self.get_common_apps()
             if not apps:
                 return None
             
@@ -148,30 +417,36 @@ class DesktopManager:
             return None
             
         except Exception as e:
-            self.logger.error(f"Error finding app {search_name}: {e}")
+            self.logger.error("Error finding app %s: %s", search_name, e)
             return None
     
     def _open_macos_app(self, app_name: str, **kwargs) -> Dict[str, Any]:
         """Open application on macOS."""
-        # Try different approaches for macOS
-        commands = [
-            # Direct app name
-            ["open", "-a", app_name],
-            # App bundle path
-            ["open", app_name],
-            # Using osascript
-            ["osascript", "-e", f'tell application "{app_name}" to activate']
-        ]
-        
-        for cmd in commands:
+        cmd = ["open", "-a", app_name]
+        try:
+            # open -a returns as soon as LaunchServices accepts the request, so a
+            # short wait on the launcher (not the app) is enough to catch bad names
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
             try:
+                _, stderr = proc.communicate(timeout=self.OPEN_LAUNCHER_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                # Launcher still handing off; treat the launch as dispatched and
+                # reap it in the background so it doesn't linger as a zombie
+                threading.Thread(target=proc.communicate, daemon=True).start()
+                return {"pid": None, "command": cmd}
+            # The pid is the launcher's, which has already exited, not the app's
+            if proc.returncode == 0:
+                return {"pid": None, "command": cmd}
+            
+            # Only fall back to AppleScript when LaunchServices can't resolve the name;
+            # the fallback depends on this result, so the two are never raced
+            if "Unable to find application" in stderr:
+                cmd = ["osascript", "-e", f'tell application "{app_name}" to activate']
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     return {"pid": None, "command": cmd}
-            except subprocess.TimeoutExpired:
-                continue
-            except Exception:
-                continue
+        except Exception:
+            pass
         
         # Provide helpful suggestions for common issues
         suggestions = []
@@ -188,63 +463,80 @@ class DesktopManager:
     
     def _open_windows_app(self, app_name: str, **kwargs) -> Dict[str, Any]:
         """Open application on Windows."""
+        if sys.platform != "win32":
+            raise ComputerTalkError(f"Could not open {app_name} on Windows: os.startfile is unavailable")
         try:
-            # Try to start the application
-            result = subprocess.run(
-                ["start", app_name], 
-                shell=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            return {"pid": None, "command": ["start", app_name]}
+            # ShellExecute directly: no cmd.exe, so the name is never parsed
+            # as a command line, and it returns without waiting for the app
+            os.startfile(app_name)
+            return {"pid": None, "command": ["startfile", app_name]}
         except Exception as e:
             raise ComputerTalkError(f"Could not open {app_name} on Windows: {e}")
     
     def _open_linux_app(self, app_name: str, **kwargs) -> Dict[str, Any]:
         """Open application on Linux."""
         try:
-            # Try different approaches for Linux
-            commands = [
-                [app_name],
-                ["xdg-open", app_name],
-                ["gnome-open", app_name],
-                ["kde-open", app_name]
-            ]
-            
-            for cmd in commands:
-                try:
-                    result = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    return {"pid": result.pid, "command": cmd}
-                except FileNotFoundError:
-                    continue
-            
-            raise ComputerTalkError(f"Could not open {app_name} on Linux")
+            # Run the app directly if it is on PATH, else hand it to a desktop opener
+            if _which(app_name):
+                cmd = [app_name]
+            else:
+                opener = next((c for c in _LINUX_OPENERS if _which(c)), None)
+                if opener is None:
+                    raise ComputerTalkError(f"Could not open {app_name} on Linux")
+                cmd = [opener, app_name]
+            
+            result = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return {"pid": result.pid, "command": cmd}
         except Exception as e:
             raise ComputerTalkError(f"Could not open {app_name} on Linux: {e}")
     
-    def list_running_apps(self) -> List[Dict[str, Any]]:
+    def list_running_apps(self, limit: Optional[int] = None, force: bool = False) -> List[Dict[str, Any]]:
         """
         List currently running applications.
         
+        Results are cached for a short time (RUNNING_APPS_TTL seconds) since
+        listing processes is comparatively expensive.
+        
+        Args:
+            limit: Maximum number of applications to return
+            force: Bypass the cache and list processes again
+            
         Returns:
             List of running application information
         """
         try:
-            if self.system == "darwin":
-                return self._list_macos_apps()
-            elif self.system == "windows":
-                return self._list_windows_apps()
-            elif self.system == "linux":
-                return self._list_linux_apps()
-            else:
+            if self._lister is None:
                 return []
+            now = time.monotonic()
+            cached_at, apps = self._running_apps_cache
+            if force or cached_at is None or now - cached_at >= self.RUNNING_APPS_TTL:
+                apps = self._lister()
+                self._running_apps_cache = (now, apps)
+            return apps if limit is None else apps[:limit]
         except Exception as e:
-            self.logger.error(f"Failed to list apps: {e}")
+            self.logger.error("Failed to list apps: %s", e)
             return []
     
     def _list_macos_apps(self) -> List[Dict[str, Any]]:
         """List running apps on macOS."""
+        # psutil reads the process table through libproc in-process, which
+        # avoids an osascript round trip to System Events
+        try:
+            apps = []
+            seen = set()
+            for proc in psutil.process_iter(["name", "exe"], ad_value=None):
+                exe = proc.info["exe"]
+                name = proc.info["name"]
+                # Only processes running from an app bundle count as apps
+                if name and exe and ".app/Contents/MacOS/" in exe and name not in seen:
+                    seen.add(name)
+                    apps.append({"name": name, "system": "macOS"})
+            return apps
+        except Exception:
+            return self._list_macos_apps_osascript()
+    
+    def _list_macos_apps_osascript(self) -> List[Dict[str, Any]]:
+        """List running apps on macOS via System Events."""
         try:
             result = subprocess.run(
                 ["osascript", "-e", "tell application \"System Events\" to get name of every process"],
@@ -261,18 +553,12 @@ class DesktopManager:
         """List running apps on Windows."""
         try:
             result = subprocess.run(
-                ["tasklist", "/fo", "csv"],
+                ["tasklist", "/fo", "csv", "/nh"],
                 capture_output=True, text=True, timeout=5
             )
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                apps = []
-                for line in lines:
-                    parts = line.split(',')
-                    if len(parts) >= 1:
-                        app_name = parts[0].strip('"')
-                        apps.append({"name": app_name, "system": "Windows"})
-                return apps
+                rows = csv.reader(io.StringIO(result.stdout))
+                return [{"name": row[0], "system": "Windows"} for row in rows if row]
             return []
         except Exception:
             return []
@@ -280,20 +566,14 @@ class DesktopManager:
     def _list_linux_apps(self) -> List[Dict[str, Any]]:
         """List running apps on Linux."""
         try:
+            # Command name only, no header; -N inverts the selection so kthreadd
+            # (pid 2) and its children, the kernel threads, are left out
             result = subprocess.run(
-                ["ps", "aux"],
+                ["ps", "-N", "--ppid", "2", "-p", "2", "-o", "comm="],
                 capture_output=True, text=True, timeout=5
             )
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                apps = []
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 11:
-                        app_name = parts[10]
-                        if not app_name.startswith('['):  # Skip kernel processes
-                            apps.append({"name": app_name, "system": "Linux"})
-                return apps
+                return [{"name": name, "system": "Linux"} for name in result.stdout.splitlines() if name]
             return []
         except Exception:
             return []
@@ -306,16 +586,11 @@ class DesktopManager:
             List of discovered applications with their names and descriptions
         """
         try:
-            if self.system == "darwin":
-                return self._discover_macos_apps()
-            elif self.system == "windows":
-                return self._discover_windows_apps()
-            elif self.system == "linux":
-                return self._discover_linux_apps()
-            else:
+            if self._discoverer is None:
                 return []
+            return self._discoverer()
         except Exception as e:
-            self.logger.error(f"Failed to discover apps: {e}")
+            self.logger.error("Failed to discover apps: %s", e)
             return []
     
     def _discover_macos_apps(self) -> List[Dict[str, Any]]:
@@ -360,11 +635,11 @@ class DesktopManager:
                             "command": app_name
                         })
             
-            self.logger.info(f"Discovered {len(apps)} macOS applications")
+            self.logger.info("Discovered %d macOS applications", len(apps))
             return apps
             
         except Exception as e:
-            self.logger.error(f"Failed to discover macOS apps: {e}")
+            self.logger.error("Failed to discover macOS apps: %s", e)
             return []
     
     def _get_app_description(self, info_plist_path: str, app_name: str) -> str:
@@ -385,60 +660,7 @@ class DesktopManager:
     
     def _generate_app_description(self, app_name: str) -> str:
         """Generate a description based on app name."""
-        descriptions = {
-            'Safari': 'Web browser',
-            'Chrome': 'Web browser', 
-            'Firefox': 'Web browser',
-            'Terminal': 'Command line terminal',
-            'Finder': 'File manager',
-            'TextEdit': 'Text editor',
-            'Notes': 'Note-taking app',
-            'Calendar': 'Calendar app',
-            'Mail': 'Email client',
-            'Messages': 'Messaging app',
-            'Spotify': 'Music streaming',
-            'VSCode': 'Code editor',
-            'Visual Studio Code': 'Code editor',
-            'Xcode': 'iOS development',
-            'Photos': 'Photo management',
-            'Preview': 'PDF and image viewer',
-            'Notion': 'Note-taking and productivity',
-            'Slack': 'Team communication',
-            'Discord': 'Voice and text chat',
-            'Zoom': 'Video conferencing',
-            'Figma': 'Design tool',
-            'PyCharm': 'Python IDE',
-            'IntelliJ IDEA': 'Java IDE',
-            'WebStorm': 'JavaScript IDE',
-            'DataGrip': 'Database IDE',
-            'Android Studio': 'Android development',
-            'Xcode': 'iOS development',
-            'iTerm': 'Terminal emulator',
-            'Alacritty': 'Terminal emulator',
-            'Hyper': 'Terminal emulator',
-            'Docker Desktop': 'Container platform',
-            'Postman': 'API development',
-            'Insomnia': 'API client',
-            'TablePlus': 'Database client',
-            'Sequel Pro': 'MySQL client',
-            'Navicat': 'Database client',
-            'MongoDB Compass': 'MongoDB client',
-            'Redis Desktop Manager': 'Redis client',
-            'DBeaver': 'Database client',
-            'MySQL Workbench': 'MySQL client',
-            'pgAdmin': 'PostgreSQL client',
-            'Robo 3T': 'MongoDB client',
-            'Studio 3T': 'MongoDB client',
-            'MongoDB Compass': 'MongoDB client',
-            'Redis Desktop Manager': 'Redis client',
-            'DBeaver': 'Database client',
-            'MySQL Workbench': 'MySQL client',
-            'pgAdmin': 'PostgreSQL client',
-            'Robo 3T': 'MongoDB client',
-            'Studio 3T': 'MongoDB client'
-        }
-        
-        return descriptions.get(app_name, f"{app_name} application")
+        return _APP_DESCRIPTIONS.get(app_name, f"{app_name} application")
     
     def _discover_windows_apps(self) -> List[Dict[str, Any]]:
         """Discover Windows applications."""
@@ -450,14 +672,25 @@ class DesktopManager:
         # Linux app discovery would go here
         return []
     
-    def get_common_apps(self) -> List[Dict[str, Any]]:
+    def get_common_apps(self, limit: Optional[int] = None, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get list of discovered applications.
         
+        Discovery always scans every installed app, once per manager, and
+        the result is reused; limit only slices that cached list. The
+        returned list is shared and should not be modified.
+        
+        Args:
+            limit: Maximum number of applications to return
+            refresh: Re-scan the system instead of using the cached result
+            
         Returns:
             List of discovered applications with their names and descriptions
         """
-        return self.discover_apps()
+        if refresh or self._discovered_apps is None:
+            self._discovered_apps = self.discover_apps()
+        apps = self._discovered_apps
+        return apps if limit is None else apps[:limit]
     
     def interact_with_app(self, app_name: str, action: str, **kwargs) -> Dict[str, Any]:
         """
@@ -472,46 +705,45 @@ class DesktopManager:
             Result of the interaction
         """
         try:
-            self.logger.info(f"Interacting with {app_name}: {action}")
-            
-            if self.system == "darwin":
-                return self._interact_macos_app(app_name, action, **kwargs)
-            elif self.system == "windows":
-                return self._interact_windows_app(app_name, action, **kwargs)
-            elif self.system == "linux":
-                return self._interact_linux_app(app_name, action, **kwargs)
-            else:
+            self.logger.info("Interacting with %s: %s", app_name, action)
+            
+            if self._interactor is None:
                 raise ComputerTalkError(f"Unsupported operating system: {self.system}")
+            return self._interactor(app_name, action, **kwargs)
                 
         except Exception as e:
-            self.logger.error(f"Failed to interact with {app_name}: {e}")
+            self.logger.error("Failed to interact with %s: %s", app_name, e)
             raise CommunicationError(f"Failed to interact with {app_name}: {e}")
     
     def _interact_macos_app(self, app_name: str, action: str, **kwargs) -> Dict[str, Any]:
         """Interact with macOS application using AppleScript."""
-        actions = {
-            "activate": f'tell application "{app_name}" to activate',
-            "close": f'tell application "{app_name}" to close',
-            "quit": f'tell application "{app_name}" to quit',
-            "minimize": f'tell application "{app_name}" to set minimized of window 1 to true',
-            "maximize": f'tell application "{app_name}" to set zoomed of window 1 to true'
-        }
-        
-        if action not in actions:
+        template = self._MACOS_ACTIONS.get(action)
+        if template is None:
             raise ComputerTalkError(f"Unknown action: {action}")
+        script = template % app_name
         
         try:
-            result = subprocess.run(
-                ["osascript", "-e", actions[action]],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            if result.returncode == 0:
-                return {"success": True, "action": action, "result": result.stdout.strip()}
-            else:
-                return {"success": False, "action": action, "error": result.stderr.strip()}
-        except Exception as e:
-            raise ComputerTalkError(f"Failed to execute action {action}: {e}")
+            success, output = _OSASCRIPT.run(script, timeout=10)
+        except _ScriptNotSent as e:
+            # Script never reached the shared interpreter; run it in its own process
+            self.logger.debug("Persistent osascript unavailable, spawning one-off: %s", e)
+            try:
+                result = subprocess.run(
+                    ["osascript", "-e", script],
+                    capture_output=True, text=True, timeout=10
+                )
+            except Exception as e:
+                raise ComputerTalkError(f"Failed to execute action {action}: {e}")
+            success = result.returncode == 0
+            output = (result.stdout if success else result.stderr).strip()
+        except OSError as e:
+            # The script was sent and may have run; re-running could close or quit twice
+            self.logger.warning("osascript failed during %s: %s", action, e)
+            return {"success": False, "action": action, "error": str(e)}
+        
+        if success:
+            return {"success": True, "action": action, "result": output}
+        return {"success": False, "action": action, "error": output}
     
     def _interact_windows_app(self, app_name: str, action: str, **kwargs) -> Dict[str, Any]:
         """Interact with Windows application."""
@@ -525,6 +757,36 @@ class DesktopManager:
         # For now, return a basic response
         return {"success": True, "action": action, "message": f"Action {action} on {app_name} (Linux)"}
     
+    def is_app_frontmost(self, app_name: str, timeout: float = 2.0) -> bool:
+        """
+        Check whether an application is the frontmost app.
+        
+        Only macOS can answer this; other platforms always report True so
+        callers waiting on an app do not block.
+        
+        Args:
+            app_name: Name of the application
+            timeout: Maximum seconds to wait for the answer
+            
+        Returns:
+            True if the app is frontmost (or the platform cannot tell)
+        """
+        if self.system != "darwin":
+            return True
+        
+        try:
+            result = subprocess.run(
+                ["osascript", "-e", 'tell application "System Events" to get name of first application process whose frontmost is true'],
+                capture_output=True, text=True, timeout=timeout
+            )
+            return result.returncode == 0 and result.stdout.strip().lower() == app_name.lower()
+        except Exception:
+            return False
+    
+    def close(self) -> None:
+        """Release the persistent AppleScript interpreter, if one is running."""
+        _OSASCRIPT.close()
+    
     def get_app_status(self, app_id: str) -> Optional[Dict[str, Any]]:
         """
         Get status of a tracked application.
@@ -535,7 +797,21 @@ class DesktopManager:
         Returns:
             Application status or None if not found
         """
-        return self.running_apps.get(app_id)
+        entry = self.running_apps.get(app_id)
+        return entry._asdict() if entry is not None else None
+    
+    def is_running(self, app_id: str) -> bool:
+        """
+        Check whether a tracked application is still marked as running.
+        
+        Args:
+            app_id: ID of the application
+            
+        Returns:
+            True if the app is tracked and not closed
+        """
+        entry = self.running_apps.get(app_id)
+        return entry is not None and entry.status == "running"
     
     def close_app(self, app_id: str) -> Dict[str, Any]:
         """
@@ -551,12 +827,36 @@ class DesktopManager:
             raise ComputerTalkError(f"Application {app_id} not found")
         
         app_info = self.running_apps[app_id]
-        app_name = app_info["name"]
+        app_name = app_info.name
         
         try:
             result = self.interact_with_app(app_name, "quit")
-            self.running_apps[app_id]["status"] = "closed"
+            self.running_apps[app_id] = app_info._replace(status="closed")
+            # Keep recently closed entries around longest before they age out
+            self.running_apps.move_to_end(app_id)
             return result
         except Exception as e:
-            self.logger.error(f"Failed to close {app_name}: {e}")
+            self.logger.error("Failed to close %s: %s", app_name, e)
+            return {"success": False, "error": str(e)}
+    
+    def close_apps(self, app_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Close several tracked applications one after another.
+        
+        Closes are not parallelised: on macOS every close goes through the
+        single shared osascript session, and elsewhere close is bookkeeping only.
+        
+        Args:
+            app_ids: IDs of the applications to close
+            
+        Returns:
+            Results in the same order as app_ids
+        """
+        return [self._close_app_safe(app_id) for app_id in app_ids]
+    
+    def _close_app_safe(self, app_id: str) -> Dict[str, Any]:
+        """Close an application, returning failures as a result dict."""
+        try:
+            return self.close_app(app_id)
+        except Exception as e:
             return {"success": False, "error": str(e)}
@@ -4,7 +4,7 @@ Tests for the core ComputerTalk functionality.
 
 import pytest
 import time
-from computer_talk.core import ComputerTalk
+from computer_talk.core import ComputerTalk, _OPEN_MSG_RE
 from computer_talk.exceptions import ComputerTalkError, CommunicationError
 
 
@@ -24,6 +24,13 @@ class TestComputerTalk:
         assert talk.config == config
         assert not talk.is_running
         
+    def test_no_instance_dict(self):
+        """Test instances only carry their slotted attributes."""
+        talk = ComputerTalk()
+        assert not hasattr(talk, "__dict__")
+        with pytest.raises(AttributeError):
+            talk.unknown_attribute = True
+        
     def test_start_stop(self):
         """Test starting and stopping the system."""
         talk = ComputerTalk()
@@ -61,6 +68,11 @@ class TestComputerTalk:
         with pytest.raises(CommunicationError, match="not running"):
             talk.send_message("test")
             
+    def test_send_message_empty(self):
+        """Test empty messages short-circuit to an empty response."""
+        talk = ComputerTalk()
+        assert talk.send_message("") == ""
+            
     def test_send_message_hello(self):
         """Test sending hello message."""
         talk = ComputerTalk()
@@ -108,6 +120,146 @@ class TestComputerTalk:
         finally:
             talk.stop()
             
+    def test_send_message_dispatch_first_word(self):
+        """Test commands dispatch on the first word only."""
+        talk = ComputerTalk()
+        talk.start()
+        
+        try:
+            assert "Hello!" in talk.send_message("Hello! there")
+            assert "contacts" in talk.send_message("list contacts")
+            assert talk.send_message("clear the table") == "Echo: clear the table"
+            assert talk.send_message("helloworld") == "Echo: helloworld"
+        finally:
+            talk.stop()
+            
+    def test_task_description_cached(self, monkeypatch):
+        """Test task queries reuse the config read until it is cleared."""
+        from computer_talk import core
+        stored = {"task": "write docs"}
+        reads = []
+        
+        def fake_get():
+            reads.append(1)
+            return stored["task"]
+        
+        def fake_set(task):
+            stored["task"] = task
+        
+        monkeypatch.setattr(core, "get_task_description", fake_get)
+        monkeypatch.setattr(core, "set_task_description", fake_set)
+        monkeypatch.setattr(core, "_task_loaded_at", None)
+        talk = ComputerTalk()
+        talk.start()
+        
+        try:
+            assert "write docs" in talk.send_message("task")
+            assert "write docs" in talk.send_message("task")
+            assert len(reads) == 1
+            
+            assert "cleared" in talk.send_message("clear task")
+            assert "No task description" in talk.send_message("task")
+            assert len(reads) == 2
+        finally:
+            talk.stop()
+            
+    def test_extract_app_name(self):
+        """Test extracting canonical app names from open commands."""
+        talk = ComputerTalk()
+        assert talk._extract_app_name("my messages app") == "Messages"
+        assert talk._extract_app_name("vscode please") == "VSCode"
+        assert talk._extract_app_name("the Notes app") == "Notes"
+        assert talk._extract_app_name("gimp now") == "Gimp"
+        
+    def test_wait_for_app_polls_until_frontmost(self, monkeypatch):
+        """Test waiting stops as soon as the app is frontmost."""
+        talk = ComputerTalk()
+        calls = []
+        
+        def fake_frontmost(app_name, timeout):
+            calls.append(timeout)
+            return len(calls) == 3
+        
+        monkeypatch.setattr(talk.desktop, "is_app_frontmost", fake_frontmost)
+        
+        assert talk._wait_for_app("Messages", timeout=2.0, interval=0.01)
+        assert len(calls) == 3
+        
+    def test_wait_for_app_respects_timeout(self, monkeypatch):
+        """Test probes share the deadline and the wait gives up in time."""
+        talk = ComputerTalk()
+        timeouts = []
+        
+        def slow_frontmost(app_name, timeout):
+            timeouts.append(timeout)
+            time.sleep(min(timeout, 0.05))
+            return False
+        
+        monkeypatch.setattr(talk.desktop, "is_app_frontmost", slow_frontmost)
+        
+        start = time.monotonic()
+        assert not talk._wait_for_app("Messages", timeout=0.3, interval=0.05)
+        assert time.monotonic() - start < 0.4
+        assert timeouts[0] == 0.3
+        assert all(t <= 0.3 for t in timeouts)
+        assert len(timeouts) <= 4
+        
+    @pytest.mark.parametrize("command, expected", [
+        (
+            "messages and send a message to Enya Mistry that says 'it works!'",
+            ("messages", "Enya Mistry", "'it works!'"),
+        ),
+        ("messages and send a message to enya saying it works!", ("messages", "enya", "it works!")),
+        ("Messages AND Send A Message TO enya SAYING hi", ("Messages", "enya", "hi")),
+        ("messages and send a message enya saying hi", ("messages", "enya", "hi")),
+        ("messages and send a message to enya it works", ("messages", "enya it works", None)),
+        ("messages and send a message to toby saying hi", ("messages", "toby", "hi")),
+        ("messages and send a message to", ("messages", None, None)),
+        ("messages and send a message", ("messages", None, None)),
+    ])
+    def test_open_message_regex(self, command, expected):
+        """Test parsing the 'open ... and send a message ...' grammar."""
+        match = _OPEN_MSG_RE.match(command)
+        assert match is not None
+        assert (match.group("app"), match.group("rcpt"), match.group("msg")) == expected
+        
+    def test_open_message_regex_no_match(self):
+        """Test other 'and' commands are left to the action handler."""
+        assert _OPEN_MSG_RE.match("safari and go to google") is None
+        
+    @pytest.mark.parametrize("command, recipient, text", [
+        ("messages and send a message to Enya Mistry that says 'it works!'", "Enya Mistry", "it works!"),
+        ("Messages AND send a message to enya saying \"hi there\"", "enya", "hi there"),
+        ("messages and send a message Enya Mistry hello there", "Enya Mistry", "hello there"),
+    ])
+    def test_handle_open_and_message_command(self, monkeypatch, command, recipient, text):
+        """Test message commands open the app and send the parsed message."""
+        sent = []
+        monkeypatch.setattr(ComputerTalk, "open_app", lambda self, name: {"success": True})
+        monkeypatch.setattr(ComputerTalk, "_wait_for_app", lambda self, name: True)
+        monkeypatch.setattr(
+            ComputerTalk, "_send_message_to_app",
+            lambda self, app, to, msg: sent.append((app, to, msg)) or {"success": True},
+        )
+        talk = ComputerTalk()
+        
+        response = talk._handle_open_and_message_command(command)
+        assert response.startswith("✅ Opened Messages and sent message")
+        assert sent == [("Messages", recipient, text)]
+        
+    @pytest.mark.parametrize("command", [
+        "messages and send a message to",
+        "messages and send a message",
+    ])
+    def test_handle_open_and_message_missing_recipient(self, monkeypatch, command):
+        """Test a message command without a recipient is a parse error."""
+        opened = []
+        monkeypatch.setattr(ComputerTalk, "open_app", lambda self, name: opened.append(name))
+        talk = ComputerTalk()
+        
+        assert talk._handle_open_command("open " + command) == f"❌ Could not parse message command: {command}"
+        assert opened == []
+        
     def test_get_status(self):
         """Test getting status information."""
         talk = ComputerTalk({"test": "value"})
@@ -133,12 +285,14 @@ class TestComputerTalk:
         talk = ComputerTalk()
         capabilities = talk.list_capabilities()
         
-        expected_capabilities = [
+        expected_capabilities = (
             "echo_messages",
             "time_queries", 
             "status_queries",
             "custom_responses",
-        ]
+            "desktop_apps",
+            "app_control",
+        )
         
         assert capabilities == expected_capabilities
         
@@ -0,0 +1,404 @@
+"""
+Tests for the DesktopManager functionality.
+"""
+
+import pytest
+from computer_talk.desktop import DesktopManager
+from computer_talk.exceptions import ComputerTalkError
+
+
+class TestDesktopManager:
+    """Test cases for DesktopManager class."""
+    
+    def test_get_common_apps_cached(self, monkeypatch):
+        """Test app discovery only runs once unless refreshed."""
+        manager = DesktopManager()
+        calls = []
+        
+        def fake_discover():
+            calls.append(1)
+            return [{"name": f"App{i}", "description": "test"} for i in range(20)]
+        
+        monkeypatch.setattr(manager, "discover_apps", fake_discover)
+        
+        assert len(manager.get_common_apps()) == 20
+        assert len(manager.get_common_apps(limit=10)) == 10
+        assert len(calls) == 1
+        
+        manager.get_common_apps(refresh=True)
+        assert len(calls) == 2
+    
+    def test_open_applications_keeps_order(self, monkeypatch):
+        """Test batch opening returns results in input order."""
+        manager = DesktopManager()
+        
+        def fake_open(app_name, **kwargs):
+            if app_name == "Broken":
+                raise RuntimeError("boom")
+            return {"success": True, "app_name": app_name}
+        
+        monkeypatch.setattr(manager, "open_application", fake_open)
+        
+        results = manager.open_applications(["Safari", "Broken", "Notes"])
+        assert [r["app_name"] for r in results] == ["Safari", "Broken", "Notes"]
+        assert [r["success"] for r in results] == [True, False, True]
+        
+    def test_open_applications_discovers_once(self, monkeypatch):
+        """Test batch opening shares a single discovery scan."""
+        manager = DesktopManager()
+        calls = []
+        
+        def fake_discover():
+            calls.append(1)
+            return [{"name": "Safari", "description": "Web browser"}]
+        
+        monkeypatch.setattr(manager, "discover_apps", fake_discover)
+        monkeypatch.setattr(manager, "_opener", lambda app_name, **kwargs: {"pid": None})
+        
+        results = manager.open_applications(["Safari", "Notes", "Mail", "Slack"] * 2)
+        assert all(r["success"] for r in results)
+        assert len(calls) == 1
+        
+    def test_close_apps_unknown_id(self):
+        """Test batch closing reports unknown IDs instead of raising."""
+        manager = DesktopManager()
+        results = manager.close_apps(["missing"])
+        assert results[0]["success"] is False
+        assert "not found" in results[0]["error"]
+        
+    def test_list_running_apps_cached(self, monkeypatch):
+        """Test running apps are cached briefly unless forced."""
+        manager = DesktopManager()
+        calls = []
+        
+        def fake_lister():
+            calls.append(1)
+            return [{"name": "App", "system": "Test"}]
+        
+        monkeypatch.setattr(manager, "_lister", fake_lister)
+        
+        manager.list_running_apps()
+        manager.list_running_apps(limit=1)
+        assert len(calls) == 1
+        
+        manager.list_running_apps(force=True)
+        assert len(calls) == 2
+        
+    def test_open_application_unique_ids(self, monkeypatch):
+        """Test apps opened back to back get distinct IDs."""
+        manager = DesktopManager()
+        monkeypatch.setattr(manager, "_find_app_by_name", lambda name: None)
+        monkeypatch.setattr(manager, "_opener", lambda name, **kwargs: {"pid": None})
+        
+        ids = {manager.open_application("Safari")["app_id"] for _ in range(5)}
+        assert len(ids) == 5
+        assert len(manager.running_apps) == 5
+        
+    def test_running_apps_bounded(self, monkeypatch):
+        """Test the oldest tracked apps are evicted past the cap."""
+        manager = DesktopManager()
+        monkeypatch.setattr(manager, "MAX_TRACKED_APPS", 3)
+        monkeypatch.setattr(manager, "_find_app_by_name", lambda name: None)
+        monkeypatch.setattr(manager, "_opener", lambda name, **kwargs: {"pid": None})
+        
+        ids = [manager.open_application(f"App{i}")["app_id"] for i in range(5)]
+        assert list(manager.running_apps) == ids[2:]
+        
+    def test_interact_macos_unknown_action(self):
+        """Test unknown macOS actions are rejected up front."""
+        manager = DesktopManager()
+        with pytest.raises(ComputerTalkError, match="Unknown action"):
+            manager._interact_macos_app("Safari", "explode")
+        
+    def test_is_running_and_status(self, monkeypatch):
+        """Test tracked app status and the is_running predicate."""
+        manager = DesktopManager()
+        monkeypatch.setattr(manager, "_find_app_by_name", lambda name: None)
+        monkeypatch.setattr(manager, "_opener", lambda name, **kwargs: {"pid": 42})
+        monkeypatch.setattr(manager, "interact_with_app", lambda name, action: {"success": True})
+        
+        app_id = manager.open_application("Safari")["app_id"]
+        assert manager.is_running(app_id)
+        assert manager.get_app_status(app_id)["pid"] == 42
+        
+        manager.close_app(app_id)
+        assert not manager.is_running(app_id)
+        assert manager.get_app_status(app_id)["status"] == "closed"
+        assert not manager.is_running("missing")
+        
+    def test_list_linux_apps_excludes_kernel_threads(self, monkeypatch):
+        """Test Linux listing asks ps to drop kthreadd's children."""
+        import subprocess
+        manager = DesktopManager()
+        seen = []
+        
+        def fake_run(cmd, **kwargs):
+            seen.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="systemd\nbash\n\nfirefox\n", stderr="")
+        
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        
+        apps = manager._list_linux_apps()
+        assert [app["name"] for app in apps] == ["systemd", "bash", "firefox"]
+        assert seen[0][:6] == ["ps", "-N", "--ppid", "2", "-p", "2"]
+        
+    def test_list_linux_apps_ps_failure(self, monkeypatch):
+        """Test a failing ps yields an empty listing."""
+        import subprocess
+        manager = DesktopManager()
+        monkeypatch.setattr(
+            subprocess, "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, stdout="", stderr="bad option")
+        )
+        assert manager._list_linux_apps() == []
+        
+    @pytest.mark.parametrize("on_path, expected", [
+        ({"gedit", "gnome-open", "kde-open"}, ["gedit"]),
+        ({"gnome-open", "kde-open"}, ["gnome-open", "gedit"]),
+    ])
+    def test_open_linux_app_command(self, monkeypatch, on_path, expected):
+        """Test Linux runs apps on PATH directly and otherwise uses the first opener."""
+        import subprocess
+        from computer_talk import desktop
+        manager = DesktopManager()
+        launched = []
+        
+        class FakePopen:
+            pid = 1234
+            
+            def __init__(self, cmd, **kwargs):
+                launched.append(cmd)
+        
+        monkeypatch.setattr(desktop, "_which", lambda name: f"/usr/bin/{name}" if name in on_path else None)
+        monkeypatch.setattr(subprocess, "Popen", FakePopen)
+        
+        result = manager._open_linux_app("gedit")
+        assert launched == [expected]
+        assert result == {"pid": 1234, "command": expected}
+        
+    def test_open_linux_app_no_opener(self, monkeypatch):
+        """Test Linux reports apps it has no way to launch."""
+        from computer_talk import desktop
+        manager = DesktopManager()
+        monkeypatch.setattr(desktop, "_which", lambda name: None)
+        with pytest.raises(ComputerTalkError, match="on Linux"):
+            manager._open_linux_app("gedit")
+        
+    def test_which_caches_hits_only(self, monkeypatch):
+        """Test PATH lookups remember found programs but retry misses."""
+        import shutil
+        from computer_talk import desktop
+        lookups = []
+        
+        def fake_which(name):
+            lookups.append(name)
+            return "/usr/bin/found" if name == "found" else None
+        
+        monkeypatch.setattr(shutil, "which", fake_which)
+        monkeypatch.setattr(desktop, "_which_cache", {})
+        
+        assert desktop._which("found") == desktop._which("found") == "/usr/bin/found"
+        assert desktop._which("missing") is None
+        assert desktop._which("missing") is None
+        assert lookups == ["found", "missing", "missing"]
+        
+    def test_open_macos_app_unknown_name(self, monkeypatch):
+        """Test a failing 'open -a' is detected and falls back to AppleScript."""
+        import subprocess
+        import sys
+        manager = DesktopManager()
+        real_popen = subprocess.Popen
+        fallback = []
+        
+        def fake_popen(cmd, **kwargs):
+            script = "import sys; sys.stderr.write('Unable to find application named x'); sys.exit(1)"
+            return real_popen([sys.executable, "-c", script], **kwargs)
+        
+        def fake_run(cmd, **kwargs):
+            fallback.append(cmd)
+            return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="not found")
+        
+        monkeypatch.setattr(subprocess, "Popen", fake_popen)
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        
+        with pytest.raises(ComputerTalkError, match="Did you mean 'open Messages'"):
+            manager._open_macos_app("Messagez app")
+        assert fallback and fallback[0][0] == "osascript"
+        
+    def test_open_macos_app_success(self, monkeypatch):
+        """Test a successful 'open -a' reports no pid for the exited launcher."""
+        import subprocess
+        import sys
+        manager = DesktopManager()
+        real_popen = subprocess.Popen
+        monkeypatch.setattr(
+            subprocess, "Popen",
+            lambda cmd, **kwargs: real_popen([sys.executable, "-c", "pass"], **kwargs)
+        )
+        
+        result = manager._open_macos_app("Safari")
+        assert result["pid"] is None
+        assert result["command"] == ["open", "-a", "Safari"]
+        
+    def test_open_macos_app_slow_launcher_reaped(self, monkeypatch):
+        """Test a launcher still running at the timeout is reaped in the background."""
+        import subprocess
+        import sys
+        import time
+        manager = DesktopManager()
+        manager.OPEN_LAUNCHER_TIMEOUT = 0.1
+        real_popen = subprocess.Popen
+        procs = []
+        
+        def fake_popen(cmd, **kwargs):
+            procs.append(real_popen([sys.executable, "-c", "import time; time.sleep(0.3)"], **kwargs))
+            return procs[-1]
+        
+        monkeypatch.setattr(subprocess, "Popen", fake_popen)
+        result = manager._open_macos_app("Safari")
+        assert result == {"pid": None, "command": ["open", "-a", "Safari"]}
+        
+        deadline = time.monotonic() + 5
+        while procs[0].returncode is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert procs[0].returncode == 0
+        
+    def test_open_windows_app_no_shell(self, monkeypatch):
+        """Test Windows launches pass the name straight to ShellExecute."""
+        import os
+        import sys
+        manager = DesktopManager()
+        started = []
+        monkeypatch.setattr(sys, "platform", "win32")
+        monkeypatch.setattr(os, "startfile", started.append, raising=False)
+        
+        result = manager._open_windows_app("notepad&calc")
+        assert started == ["notepad&calc"]
+        assert result["command"] == ["startfile", "notepad&calc"]
+        
+    def test_open_windows_app_off_windows(self, monkeypatch):
+        """Test the Windows opener refuses to run on other platforms."""
+        import sys
+        manager = DesktopManager()
+        monkeypatch.setattr(sys, "platform", "linux")
+        with pytest.raises(ComputerTalkError, match="on Windows"):
+            manager._open_windows_app("notepad")
+
+
+# Stand-in for "osascript -i": echoes a prompt and a result per line,
+# reports an AppleScript error for "bad", hangs on "hang" and exits on "die"
+FAKE_OSASCRIPT = r'''
+import sys, time
+for line in sys.stdin:
+    line = line.strip()
+    sys.stdout.write(">> ")
+    if line.startswith('"'):
+        print("=> " + line)
+    elif line == "bad":
+        print("0:3: execution error: nope (-1728)")
+    elif line == "hang":
+        sys.stdout.flush()
+        time.sleep(30)
+    elif line == "die":
+        sys.exit(1)
+    else:
+        print("=> ran " + line)
+    sys.stdout.flush()
+'''
+
+
+class TestOsascriptSession:
+    """Test cases for the persistent osascript session."""
+    
+    @pytest.fixture
+    def session(self):
+        import sys
+        from computer_talk.desktop import _OsascriptSession
+        session = _OsascriptSession((sys.executable, "-u", "-c", FAKE_OSASCRIPT))
+        yield session
+        session.close()
+        
+    def test_run_reuses_process(self, session):
+        """Test scripts run in one interpreter and return their result."""
+        assert session.run("activate") == (True, "ran activate")
+        pid = session._proc.pid
+        assert session.run("quit") == (True, "ran quit")
+        assert session._proc.pid == pid
+        
+    def test_run_reports_errors(self, session):
+        """Test AppleScript errors are returned as failures."""
+        success, output = session.run("bad")
+        assert not success
+        assert "execution error" in output
+        assert session.run("ok") == (True, "ran ok")
+        
+    def test_run_timeout(self, session):
+        """Test a hung interpreter raises and disables the session."""
+        from computer_talk.desktop import _ScriptNotSent
+        with pytest.raises(OSError, match="in time") as excinfo:
+            session.run("hang", timeout=0.5)
+        assert not isinstance(excinfo.value, _ScriptNotSent)
+        assert session._proc is None
+        with pytest.raises(_ScriptNotSent):
+            session.run("again")
+        
+    def test_run_dead_process(self, session):
+        """Test an interpreter that exits raises and disables the session."""
+        from computer_talk.desktop import _ScriptNotSent
+        with pytest.raises(OSError, match="exited") as excinfo:
+            session.run("die")
+        assert not isinstance(excinfo.value, _ScriptNotSent)
+        with pytest.raises(_ScriptNotSent):
+            session.run("again")
+        
+    def test_run_spawn_failure(self):
+        """Test a missing interpreter reports the script as not sent."""
+        from computer_talk.desktop import _OsascriptSession, _ScriptNotSent
+        session = _OsascriptSession(("/nonexistent/osascript", "-i"))
+        with pytest.raises(_ScriptNotSent):
+            session.run("activate")
+        
+    def test_close(self, session):
+        """Test close terminates the interpreter."""
+        session.run("activate")
+        proc = session._proc
+        session.close()
+        assert session._proc is None
+        assert proc.poll() is not None
+
+    def test_interact_not_rerun_after_delivery(self, monkeypatch):
+        """Test a script that timed out after delivery is not run again."""
+        from computer_talk import desktop
+        manager = DesktopManager()
+        
+        def fake_run(script, timeout=10):
+            raise OSError("osascript did not respond in time")
+        
+        def fail_oneoff(*args, **kwargs):
+            raise AssertionError("script re-run in a one-off osascript")
+        
+        monkeypatch.setattr(desktop._OSASCRIPT, "run", fake_run)
+        monkeypatch.setattr(desktop.subprocess, "run", fail_oneoff)
+        result = manager._interact_macos_app("Safari", "quit")
+        assert result["success"] is False
+        assert "in time" in result["error"]
+        
+    def test_interact_falls_back_when_not_sent(self, monkeypatch):
+        """Test a script that never reached the interpreter runs one-off."""
+        import subprocess
+        from computer_talk import desktop
+        manager = DesktopManager()
+        calls = []
+        
+        def fake_run(script, timeout=10):
+            raise desktop._ScriptNotSent("osascript session disabled")
+        
+        def fake_oneoff(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+        
+        monkeypatch.setattr(desktop._OSASCRIPT, "run", fake_run)
+        monkeypatch.setattr(desktop.subprocess, "run", fake_oneoff)
+        result = manager._interact_macos_app("Safari", "quit")
+        assert result["success"] is True
+        assert calls == [["osascript", "-e", 'tell application "Safari" to quit']]